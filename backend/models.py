@@ -17,7 +17,9 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     Float,
+    Index,
     Text,
+    func,
 )
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from database import Base
@@ -177,3 +179,20 @@ class Payment(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     application = relationship("Application", back_populates="payments")
+
+
+# Composite indexes backing the hot query predicates: /pipeline filters on
+# recruiter/status and orders by created_at, /reports/earnings scans payments
+# by paid_date, and list_candidates matches on lowercased full_name.
+Index(
+    "ix_applications_recruiter_status_created",
+    Application.recruiter_id,
+    Application.status,
+    Application.created_at.desc(),
+)
+Index(
+    "ix_payments_paid_date_application",
+    Payment.paid_date.desc(),
+    Payment.application_id,
+)
+Index("ix_candidates_full_name_lower", func.lower(Candidate.full_name))
@@ -22,6 +22,7 @@ CREATE TABLE candidates (
 );
 CREATE INDEX ix_candidates_id ON candidates (id);
 CREATE INDEX ix_candidates_full_name ON candidates (full_name);
+CREATE INDEX ix_candidates_full_name_lower ON candidates (lower(full_name));
 CREATE TABLE vacancies (
 	id INTEGER NOT NULL, 
 	client_id INTEGER NOT NULL, 
@@ -64,6 +65,7 @@ CREATE INDEX ix_applications_status ON applications (status);
 CREATE INDEX ix_applications_id ON applications (id);
 CREATE INDEX ix_applications_date_contacted ON applications (date_contacted);
 CREATE INDEX ix_applications_paid ON applications (paid);
+CREATE INDEX ix_applications_recruiter_status_created ON applications (recruiter_id, status, created_at DESC);
 CREATE TABLE payments (
 	id INTEGER NOT NULL, 
 	application_id INTEGER NOT NULL, 
@@ -76,6 +78,7 @@ CREATE TABLE payments (
 );
 CREATE INDEX ix_payments_paid_date ON payments (paid_date);
 CREATE INDEX ix_payments_application_id ON payments (application_id);
+CREATE INDEX ix_payments_paid_date_application ON payments (paid_date DESC, application_id);
 CREATE INDEX ix_payments_id ON payments (id);
 CREATE TABLE users (
 	id INTEGER NOT NULL, 
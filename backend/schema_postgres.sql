@@ -1,16 +1,21 @@
 -- PostgreSQL compatible schema
 
+-- Trigram indexes below make the ILIKE '%...%' searches index-backed.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 CREATE TABLE clients (
 	id SERIAL PRIMARY KEY,
 	name VARCHAR(120) NOT NULL UNIQUE
 );
 CREATE INDEX ix_clients_name ON clients (name);
+CREATE INDEX ix_clients_name_trgm ON clients USING gin (name gin_trgm_ops);
 
 CREATE TABLE recruiters (
 	id SERIAL PRIMARY KEY,
 	name VARCHAR(120) NOT NULL UNIQUE
 );
 CREATE INDEX ix_recruiters_name ON recruiters (name);
+CREATE INDEX ix_recruiters_name_trgm ON recruiters USING gin (name gin_trgm_ops);
 
 CREATE TABLE candidates (
 	id SERIAL PRIMARY KEY,
@@ -20,6 +25,10 @@ CREATE TABLE candidates (
 	notes TEXT
 );
 CREATE INDEX ix_candidates_full_name ON candidates (full_name);
+CREATE INDEX ix_candidates_full_name_lower ON candidates (lower(full_name));
+CREATE INDEX ix_candidates_full_name_trgm ON candidates USING gin (full_name gin_trgm_ops);
+CREATE INDEX ix_candidates_phone_trgm ON candidates USING gin (phone gin_trgm_ops);
+CREATE INDEX ix_candidates_email_trgm ON candidates USING gin (email gin_trgm_ops);
 
 CREATE TABLE vacancies (
 	id SERIAL PRIMARY KEY,
@@ -29,6 +38,7 @@ CREATE TABLE vacancies (
 	city VARCHAR(120)
 );
 CREATE INDEX ix_vacancies_title ON vacancies (title);
+CREATE INDEX ix_vacancies_title_trgm ON vacancies USING gin (title gin_trgm_ops);
 CREATE INDEX ix_vacancies_client_id ON vacancies (client_id);
 
 CREATE TABLE applications (
@@ -56,6 +66,7 @@ CREATE INDEX ix_applications_recruiter_id ON applications (recruiter_id);
 CREATE INDEX ix_applications_status ON applications (status);
 CREATE INDEX ix_applications_date_contacted ON applications (date_contacted);
 CREATE INDEX ix_applications_paid ON applications (paid);
+CREATE INDEX ix_applications_recruiter_status_created ON applications (recruiter_id, status, created_at DESC);
 
 CREATE TABLE payments (
 	id SERIAL PRIMARY KEY,
@@ -67,6 +78,7 @@ CREATE TABLE payments (
 );
 CREATE INDEX ix_payments_paid_date ON payments (paid_date);
 CREATE INDEX ix_payments_application_id ON payments (application_id);
+CREATE INDEX ix_payments_paid_date_application ON payments (paid_date DESC, application_id);
 
 CREATE TABLE users (
 	id SERIAL PRIMARY KEY,